@@ -13,6 +13,10 @@ Output (auto-versioned by blueprint title + timestamp):
 Optional:
   --out <filename.md>      Override the auto output name (still writes a log)
   --debug-csv              Write a flat debug CSV (builders only)
+  --verbose                Echo the log to the console even when output is redirected
+
+Requires Python 3.8+. Uses lxml when installed (faster on large blueprints);
+falls back to the standard library otherwise.
 
 What it extracts (V1.05):
   - Timer blocks: toolbar actions (Toolbar/Slots/Slot/Data)
@@ -26,61 +30,87 @@ What it extracts (V1.05):
 Run:
   python3 se_logic_hud_v1_05.py bp.sbc
   python3 se_logic_hud_v1_05.py bp.sbc --debug-csv
+  python3 se_logic_hud_v1_05.py bp.sbc --verbose > run.txt
   python3 se_logic_hud_v1_05.py bp.sbc --out SE_Logic_HUD.md
 """
 
 from __future__ import annotations
 
+import gc
+import re
 import sys
 import csv
-import xml.etree.ElementTree as ET
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass
+from typing import Callable, Dict, List, NamedTuple, TextIO, Tuple, Optional
+
+# lxml streams large blueprints much faster; stdlib keeps the tool dependency-free.
+try:
+    from lxml import etree as ET
+    HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
 
 # Space Engineers blueprint XML uses xsi:type
 NS = {"xsi": "http://www.w3.org/2001/XMLSchema-instance"}
 XSI_TYPE_ATTR = f"{{{NS['xsi']}}}type"
 
+# SE exports use no default namespace, so plain tags are fully-qualified.
+CUBEBLOCK_TAG = "MyObjectBuilder_CubeBlock"
+DISPLAYNAME_TAG = "DisplayName"
+
+# xsi:type values compared in hot loops (interned once at import)
+TYPE_TIMER = sys.intern("MyObjectBuilder_TimerBlock")
+TYPE_EVENT = sys.intern("MyObjectBuilder_EventControllerBlock")
+TYPE_TB_BLOCK = sys.intern("MyObjectBuilder_ToolbarItemTerminalBlock")
+TYPE_TB_GROUP = sys.intern("MyObjectBuilder_ToolbarItemTerminalGroup")
+
+CONTROLLER_TYPES = frozenset((TYPE_TIMER, TYPE_EVENT))
+
+# Blueprint title sits near the top of bp.sbc; sniff this much before a full parse
+TITLE_SNIFF_BYTES = 16 * 1024
+
+# Output buffering (large blueprints produce big HUD/CSV files)
+WRITE_BUFFER_BYTES = 1 << 20
+
 
 # -------------------------
 # Small utilities (XML + strings)
 # -------------------------
 
+_LOCAL_NAMES: Dict[str, str] = {}
+
+
 def local(tag: str) -> str:
-    """Strip XML namespace from tag name."""
-    return tag.split("}", 1)[1] if "}" in tag else tag
+    """Strip XML namespace from tag name (memoized; blueprints reuse a handful of tags)."""
+    name = _LOCAL_NAMES.get(tag)
+    if name is None:
+        name = _LOCAL_NAMES[tag] = tag.split("}", 1)[1] if "}" in tag else tag
+    return name
 
 
-def clean(s) -> str:
-    """Normalize whitespace."""
+def clean(s: Optional[str]) -> str:
+    """Normalize whitespace (split() already drops leading/trailing runs)."""
     if s is None:
         return ""
-    return " ".join(str(s).strip().split())
+    return " ".join(s.split())
 
 
-def child_text(node, tagname: str, default: str = "") -> str:
-    """Get direct child text by local tag name."""
+def children_by_local(node) -> dict:
+    """Map local tag name -> first direct child (one scan serves every lookup)."""
+    d = {}
     for c in node:
-        if local(c.tag) == tagname:
-            return clean(c.text or "")
-    return default
+        d.setdefault(local(c.tag), c)
+    return d
 
 
-def first_child(node, tagname: str):
-    """Get first direct child by local tag name."""
-    for c in node:
-        if local(c.tag) == tagname:
-            return c
-    return None
-
-
-def iter_children(node, tagname: str):
-    """Iterate direct children by local tag name."""
-    for c in node:
-        if local(c.tag) == tagname:
-            yield c
+def text_of(children: dict, tagname: str, default: str = "") -> str:
+    """Cleaned text of a child from a children_by_local() map."""
+    node = children.get(tagname)
+    return clean(node.text or "") if node is not None else default
 
 
 def sanitize_filename(s: str) -> str:
@@ -99,24 +129,58 @@ def sanitize_filename(s: str) -> str:
 # -------------------------
 
 class Logger:
-    def __init__(self, log_path: Path):
+    """
+    Buffered run log, opened up front so early failures still leave a file.
+    The final name may not be known yet; rename() moves it once it is.
+    """
+
+    def __init__(self, log_path: Path, echo: bool = True):
         self.log_path = log_path
-        self._lines: List[str] = []
+        self.echo = echo  # mirror to console (interactive runs / --verbose)
+        self._fh = log_path.open("w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES)
 
-    def write(self, msg: str) -> None:
+    def write(self, msg: str, console: bool = False) -> None:
+        """console=True echoes even when mirroring is off (errors)."""
         line = msg.rstrip("\n")
-        print(line)
-        self._lines.append(line)
+        if self.echo or console:
+            print(line)
+        self._fh.write(line)
+        self._fh.write("\n")
+
+    def rename(self, new_path: Path) -> None:
+        # Close first: Windows refuses to rename an open file.
+        if new_path == self.log_path:
+            return
+        self._fh.close()
+        self.log_path = self.log_path.replace(new_path)
+        self._fh = self.log_path.open("a", encoding="utf-8", buffering=WRITE_BUFFER_BYTES)
 
-    def flush_to_disk(self) -> None:
-        self.log_path.write_text("\n".join(self._lines).strip() + "\n", encoding="utf-8")
+    def close(self) -> None:
+        self._fh.close()
+
+
+# -------------------------
+# Rows
+# -------------------------
+
+class Row(NamedTuple):
+    """One toolbar slot. source_type/source_name live on the owning Controller."""
+    slot_index: str
+    action: str
+    target: str
+    target_kind: str
+    flag: str  # "" | EMPTY_SLOT | MISSING_TARGET
 
 
 # -------------------------
 # Missing-target classification (your rule)
 # -------------------------
 
-def classify_missing_source(source_name: str, rows_for_source: List[dict]) -> str:
+# Case-insensitive "AQR-" match without upper-casing whole names
+_AQR_RE = re.compile("AQR-", re.IGNORECASE)
+
+
+def classify_missing_source(source_name: str, rows_for_source: List[Row]) -> str:
     """
     Return: 'LIKELY_DETACHED_AQR' | 'LIKELY_BROKEN_LINK'
 
@@ -124,13 +188,13 @@ def classify_missing_source(source_name: str, rows_for_source: List[dict]) -> st
       If the controller name is AQR-* (or group targets include AQR-*),
       treat missing block targets as intended detached module control by default.
     """
-    s = (source_name or "").upper()
-    if "AQR-" in s:
+    if source_name and _AQR_RE.search(source_name):
         return "LIKELY_DETACHED_AQR"
 
     for r in rows_for_source:
-        tgt = (r.get("target") or "").upper()
-        if tgt.startswith("GROUP:") and "AQR-" in tgt:
+        tgt = r.target
+        # Only group targets qualify: cheap 6-char prefix test first
+        if tgt and tgt[:6].upper() == "GROUP:" and _AQR_RE.search(tgt):
             return "LIKELY_DETACHED_AQR"
 
     return "LIKELY_BROKEN_LINK"
@@ -140,31 +204,77 @@ def classify_missing_source(source_name: str, rows_for_source: List[dict]) -> st
 # Core extraction
 # -------------------------
 
-def build_block_index(root) -> Dict[str, dict]:
-    """
-    Build EntityId -> {name, type} for placed blocks.
-    Names are pulled from CustomName first (player-visible).
+@dataclass
+class Controller:
+    """A named Timer/EventController: its toolbar rows plus the cached missing-target class."""
+    name: str
+    rows: List[Row]
+    missing_class: str  # classify_missing_source(name, rows), computed once
+
+
+def scan_blocks(bp_path: Path):
     """
-    idx: Dict[str, dict] = {}
-    for b in root.iter():
-        if local(b.tag) != "MyObjectBuilder_CubeBlock":
-            continue
-        ent = child_text(b, "EntityId", "")
-        if not ent:
-            continue
-        name = (
-            child_text(b, "CustomName", "")
-            or child_text(b, "DisplayName", "")
-            or child_text(b, "SubtypeName", "")
-        )
-        idx[ent] = {
-            "name": name if name else "(unnamed block)",
-            "type": b.attrib.get(XSI_TYPE_ATTR, ""),
-        }
-    return idx
+    Single streaming pass over bp.sbc (replaces separate index + extract walks).
 
+    Every CubeBlock is indexed as EntityId -> (name, type); names are pulled
+    from CustomName first (player-visible). Named Timer/EventController blocks
+    are stashed for extract_controllers(), which runs once the index is
+    complete. All other blocks are freed as soon as they are indexed, so the
+    full DOM never materializes.
 
-def parse_toolbar_slots(block, block_index: Dict[str, dict], source_type: str, source_name: str) -> List[dict]:
+    Return:
+      block_index: Dict[entity_id -> (name, xsi:type)], both strings interned
+      controllers: [(xsi:type, controller_name, block_element)] in document order
+      root: pruned document skeleton (block subtrees cleared)
+    """
+    block_index: Dict[str, Tuple[str, str]] = {}
+    controllers: List[Tuple[str, str, object]] = []
+
+    # Hot-loop locals
+    xsi_type = XSI_TYPE_ATTR
+    cube_tag = CUBEBLOCK_TAG
+    prune_siblings = HAVE_LXML
+
+    with bp_path.open("rb") as f:
+        if HAVE_LXML:
+            context = ET.iterparse(f, events=("end",), tag=CUBEBLOCK_TAG,
+                                   remove_comments=True, remove_pis=True)
+        else:
+            context = ET.iterparse(f, events=("end",))
+
+        for _, b in context:
+            if b.tag != cube_tag:
+                continue  # stdlib iterparse has no tag filter
+
+            xtype = b.attrib.get(xsi_type, "")
+            fields = children_by_local(b)
+            ent = text_of(fields, "EntityId", "")
+            if ent:
+                name = (
+                    text_of(fields, "CustomName", "")
+                    or text_of(fields, "DisplayName", "")
+                    or text_of(fields, "SubtypeName", "")
+                )
+                # Interned: names/types repeat across thousands of blocks
+                block_index[ent] = (sys.intern(name or "(unnamed block)"), sys.intern(xtype))
+
+            if xtype in CONTROLLER_TYPES:
+                ctrl_name = text_of(fields, "CustomName", "")
+                if ctrl_name:  # unnamed blocks are noise for HUD
+                    # Keep the element alive (toolbar intact) for the second pass.
+                    controllers.append((xtype, ctrl_name, b))
+                    continue
+
+            b.clear()
+            if prune_siblings:
+                # Drop already-processed siblings so the parent doesn't grow.
+                while b.getprevious() is not None:
+                    del b.getparent()[0]
+
+        return block_index, controllers, context.root
+
+
+def parse_toolbar_slots(block, block_index: Dict[str, Tuple[str, str]]) -> List[Row]:
     """
     Parse Toolbar/Slots/Slot/Data.
 
@@ -172,108 +282,132 @@ def parse_toolbar_slots(block, block_index: Dict[str, dict], source_type: str, s
       - MyObjectBuilder_ToolbarItemTerminalBlock: target via BlockEntityId
       - MyObjectBuilder_ToolbarItemTerminalGroup: target via GroupName
     """
-    rows: List[dict] = []
+    rows: List[Row] = []
+    append = rows.append
+    xsi_type = XSI_TYPE_ATTR
 
-    toolbar = first_child(block, "Toolbar")
+    toolbar = children_by_local(block).get("Toolbar")
     if toolbar is None:
         return rows
 
-    slots = first_child(toolbar, "Slots")
+    slots = children_by_local(toolbar).get("Slots")
     if slots is None:
         return rows
 
-    for slot in iter_children(slots, "Slot"):
-        slot_index = child_text(slot, "Index", "")
+    for slot in slots:
+        if local(slot.tag) != "Slot":
+            continue
+        slot_fields = children_by_local(slot)
+        slot_index = text_of(slot_fields, "Index", "")
 
-        data = first_child(slot, "Data")
+        data = slot_fields.get("Data")
         if data is None:
             # Grey cube / blank slot
-            rows.append({
-                "source_type": source_type,
-                "source_name": source_name,
-                "slot_index": slot_index,
-                "action": "<EMPTY SLOT>",
-                "target": "n/a",
-                "target_kind": "none",
-                "flag": "EMPTY_SLOT",
-            })
+            append(Row(slot_index, "<EMPTY SLOT>", "n/a", "none", "EMPTY_SLOT"))
             continue
 
-        data_type = data.attrib.get(XSI_TYPE_ATTR, "")
-        action = child_text(data, "Action", "") or "n/a"
+        data_type = data.attrib.get(xsi_type, "")
+        data_fields = children_by_local(data)
+        action = text_of(data_fields, "Action", "") or "n/a"
 
-        block_ent = child_text(data, "BlockEntityId", "")
-        group_name = child_text(data, "GroupName", "")
+        block_ent = text_of(data_fields, "BlockEntityId", "")
+        group_name = text_of(data_fields, "GroupName", "")
 
         target_kind = "unknown"
         target_name = "n/a"
         flag = ""
 
-        if data_type == "MyObjectBuilder_ToolbarItemTerminalGroup" and group_name:
+        if data_type == TYPE_TB_GROUP and group_name:
             target_kind = "group"
             target_name = f"GROUP:{group_name}"
 
-        elif data_type == "MyObjectBuilder_ToolbarItemTerminalBlock" and block_ent:
+        elif data_type == TYPE_TB_BLOCK and block_ent:
             target_kind = "block"
             if block_ent in block_index:
-                target_name = block_index[block_ent]["name"]
+                target_name = block_index[block_ent][0]
             else:
                 target_name = "(missing target)"
                 flag = "MISSING_TARGET"
 
-        # Append parameter values (compact) if present
-        params = first_child(data, "Parameters")
-        if params is not None:
-            vals: List[str] = []
-            for p in params.iter():
-                if local(p.tag) == "Value" and (p.text is not None):
-                    vals.append(clean(p.text))
+        # Append parameter values (compact) if present. Most slots carry an
+        # empty <Parameters />, so skip those before touching the subtree.
+        params = data_fields.get("Parameters")
+        if params is not None and len(params):
+            # Values sit one level down (Parameters/<ActionParameter>/Value),
+            # so walk the subtree, tag-filtered by the parser.
+            vals = [clean(p.text) for p in params.iter("Value") if p.text is not None]
             if vals:
                 action = f"{action} ({', '.join(vals)})"
 
-        rows.append({
-            "source_type": source_type,
-            "source_name": source_name,
-            "slot_index": slot_index,
-            "action": action,
-            "target": target_name,
-            "target_kind": target_kind,
-            "flag": flag,
-        })
+        append(Row(slot_index, action, target_name, target_kind, flag))
 
     return rows
 
 
-def extract_controllers(root, block_index: Dict[str, dict]):
+def extract_controllers(controllers: List[Tuple[str, str, object]], block_index: Dict[str, Tuple[str, str]]):
     """
+    Build toolbar rows for the controllers stashed by scan_blocks().
+
+    Rows for same-named controllers are merged, then each controller is
+    classified once so render/log code never re-scans its rows.
+
     Return:
-      timers: Dict[timer_name -> rows]
-      events: Dict[event_controller_name -> rows]
+      timers: Dict[timer_name -> Controller]
+      events: Dict[event_controller_name -> Controller]
     """
-    timers: Dict[str, List[dict]] = defaultdict(list)
-    events: Dict[str, List[dict]] = defaultdict(list)
+    timers: Dict[str, List[Row]] = defaultdict(list)
+    events: Dict[str, List[Row]] = defaultdict(list)
+    by_type = {TYPE_TIMER: timers, TYPE_EVENT: events}
+
+    for xtype, name, b in controllers:
+        by_name = by_type.get(xtype)
+        if by_name is not None:
+            by_name[name].extend(parse_toolbar_slots(b, block_index))
+
+    def finalize(by_name: Dict[str, List[Row]]) -> Dict[str, Controller]:
+        return {
+            name: Controller(name, rows, classify_missing_source(name, rows))
+            for name, rows in by_name.items()
+        }
 
-    for b in root.iter():
-        if local(b.tag) != "MyObjectBuilder_CubeBlock":
-            continue
+    return finalize(timers), finalize(events)
 
-        xtype = b.attrib.get(XSI_TYPE_ATTR, "")
-        name = child_text(b, "CustomName", "").strip()
-        if not name:
-            continue  # unnamed blocks are noise for HUD
 
-        if xtype == "MyObjectBuilder_TimerBlock":
-            timers[name].extend(parse_toolbar_slots(b, block_index, "Timer", name))
+# -------------------------
+# Blueprint title extraction (for output naming)
+# -------------------------
+
+_DISPLAYNAME_OPEN_RE = re.compile(rb"<DisplayName(?=[\s/>])[^>]*>")
+_DISPLAYNAME_BODY_RE = re.compile(rb"([^<&]*)</DisplayName>")
 
-        elif xtype == "MyObjectBuilder_EventControllerBlock":
-            events[name].extend(parse_toolbar_slots(b, block_index, "EventController", name))
 
-    return timers, events
+def sniff_blueprint_title(bp_path: Path) -> Optional[str]:
+    """
+    Fast path: read the first <DisplayName> straight from the file head.
 
+    Returns None whenever the head is not plain enough to trust without a
+    parser (comments/CDATA/DOCTYPE, entities, nested markup, truncation);
+    callers then fall back to extract_blueprint_title().
+    """
+    with bp_path.open("rb") as f:
+        head = f.read(TITLE_SNIFF_BYTES)
+
+    for m in _DISPLAYNAME_OPEN_RE.finditer(head):
+        if b"<!" in head[:m.start()]:
+            return None
+        if m.group(0).endswith(b"/>"):
+            continue  # <DisplayName /> carries no text
+        body = _DISPLAYNAME_BODY_RE.match(head, m.end())
+        if body is None:
+            return None
+        try:
+            title = clean(body.group(1).decode("utf-8"))
+        except UnicodeDecodeError:
+            return None
+        if title:
+            return title
+    return None
 
-# -------------------------
-# Blueprint title extraction (for output naming)
-# -------------------------
 
 def extract_blueprint_title(root, bp_path: Path) -> str:
     """
@@ -281,143 +415,149 @@ def extract_blueprint_title(root, bp_path: Path) -> str:
     - First try any <DisplayName> tag anywhere (common in SE exports)
     - Fallback to filename stem
     """
-    for n in root.iter():
-        if local(n.tag) == "DisplayName" and (n.text and clean(n.text)):
-            return clean(n.text)
+    for n in root.iter(DISPLAYNAME_TAG):  # tag filter runs inside the parser library
+        title = clean(n.text)
+        if title:
+            return title
     return bp_path.stem
 
 
 # -------------------------
-# Render HUD
+# Summary stats (shared by log + HUD)
 # -------------------------
 
-def render_hud(timers: Dict[str, List[dict]], events: Dict[str, List[dict]], generated_at: str) -> str:
-    # Collect attrition + missing lists (grouped by controller so we preserve slot order)
+@dataclass
+class Stats:
+    """Attrition + missing-target summary, collected in one pass over all rows."""
+    empty_slots: int
+    # (source_type, source_name) -> [(slot, action)], grouped by controller so slot order is preserved
+    missing_detached_by_source: Dict[Tuple[str, str], List[Tuple[str, str]]]
+    missing_broken_by_source: Dict[Tuple[str, str], List[Tuple[str, str]]]
+    missing_detached: int
+    missing_broken: int
+
+    @property
+    def missing_total(self) -> int:
+        return self.missing_detached + self.missing_broken
+
+
+def compute_stats(timers: Dict[str, Controller], events: Dict[str, Controller]) -> Stats:
     empty_slots = 0
-    missing_detached_by_source: Dict[Tuple[str, str], List[Tuple[str, str]]] = defaultdict(list)  # (type,name)->[(slot,action)]
+    missing_detached_by_source: Dict[Tuple[str, str], List[Tuple[str, str]]] = defaultdict(list)
     missing_broken_by_source: Dict[Tuple[str, str], List[Tuple[str, str]]] = defaultdict(list)
 
-    def collect(source_type: str, source_name: str, rows: List[dict]):
-        nonlocal empty_slots
-        missing_class = classify_missing_source(source_name, rows)
-        for r in rows:
-            if r.get("flag") == "EMPTY_SLOT":
-                empty_slots += 1
-            if r.get("flag") == "MISSING_TARGET":
-                key = (source_type, source_name)
-                item = (r.get("slot_index", ""), r.get("action", ""))
-                if missing_class == "LIKELY_DETACHED_AQR":
-                    missing_detached_by_source[key].append(item)
-                else:
-                    missing_broken_by_source[key].append(item)
-
-    for name, rows in timers.items():
-        collect("Timer", name, rows)
-    for name, rows in events.items():
-        collect("EventController", name, rows)
-
-    missing_detached_count = sum(len(v) for v in missing_detached_by_source.values())
-    missing_broken_count = sum(len(v) for v in missing_broken_by_source.values())
-
-    lines: List[str] = []
-    lines.append("# SE Logic HUD (V1.05) — Raw Cast Orbital")
-    lines.append("")
-    lines.append(f"- Generated: `{generated_at}`")
-    lines.append(f"- Timers: `{len(timers)}`")
-    lines.append(f"- Event Controllers: `{len(events)}`")
-    lines.append(f"- Attrition: `{empty_slots}` empty slots")
-    lines.append(
-        f"- Missing targets split: `{missing_detached_count}` likely detached (AQR-module), "
-        f"`{missing_broken_count}` likely broken links"
+    for source_type, controllers in (("Timer", timers), ("EventController", events)):
+        for ctrl in controllers.values():
+            for r in ctrl.rows:
+                if r.flag == "EMPTY_SLOT":
+                    empty_slots += 1
+                if r.flag == "MISSING_TARGET":
+                    key = (source_type, ctrl.name)
+                    item = (r.slot_index, r.action)
+                    if ctrl.missing_class == "LIKELY_DETACHED_AQR":
+                        missing_detached_by_source[key].append(item)
+                    else:
+                        missing_broken_by_source[key].append(item)
+
+    return Stats(
+        empty_slots=empty_slots,
+        missing_detached_by_source=missing_detached_by_source,
+        missing_broken_by_source=missing_broken_by_source,
+        missing_detached=sum(len(v) for v in missing_detached_by_source.values()),
+        missing_broken=sum(len(v) for v in missing_broken_by_source.values()),
+    )
+
+
+# -------------------------
+# Render HUD
+# -------------------------
+
+def _emit_section(emit: Callable[[str], None], header: str, label: str, controllers: List[Controller]) -> None:
+    """Write one A→Z controller section (shared by Timers and Event Controllers)."""
+    emit(header)
+    for ctrl in controllers:
+        emit("")
+        emit(f"### {label}: {ctrl.name}")
+        emit("")
+        emit("Actions:")
+        if not ctrl.rows:
+            emit("- n/a")
+        else:
+            for r in ctrl.rows:
+                suffix = ""
+                if r.flag == "MISSING_TARGET":
+                    suffix = " ⚪ likely detached" if ctrl.missing_class == "LIKELY_DETACHED_AQR" else " 🧱 likely broken"
+                emit(f"- Slot {r.slot_index}: {r.action} → {r.target}{suffix}")
+
+
+def render_hud(timers: Dict[str, Controller], events: Dict[str, Controller], stats: Stats,
+               generated_at: str, out: TextIO) -> None:
+    """Stream the HUD markdown to out (never held in memory as a whole)."""
+    # Case-insensitive A→Z order, computed once and reused by every section below
+    timer_order = sorted(timers.values(), key=lambda c: c.name.lower())
+    event_order = sorted(events.values(), key=lambda c: c.name.lower())
+
+    missing_detached_by_source = stats.missing_detached_by_source
+    missing_broken_by_source = stats.missing_broken_by_source
+
+    def emit(line: str) -> None:
+        out.write(line)
+        out.write("\n")
+
+    emit("# SE Logic HUD (V1.05) — Raw Cast Orbital")
+    emit("")
+    emit(f"- Generated: `{generated_at}`")
+    emit(f"- Timers: `{len(timers)}`")
+    emit(f"- Event Controllers: `{len(events)}`")
+    emit(f"- Attrition: `{stats.empty_slots}` empty slots")
+    emit(
+        f"- Missing targets split: `{stats.missing_detached}` likely detached (AQR-module), "
+        f"`{stats.missing_broken}` likely broken links"
     )
-    lines.append("")
+    emit("")
 
     # Repair list (top)
-    lines.append("## Repair List — Missing Targets")
-    lines.append("")
+    emit("## Repair List — Missing Targets")
+    emit("")
 
-    lines.append("### Likely Detached AQR Module (greyed out expected)")
+    emit("### Likely Detached AQR Module (greyed out expected)")
     if not missing_detached_by_source:
-        lines.append("- none")
+        emit("- none")
     else:
         for (st, sn) in sorted(missing_detached_by_source.keys(), key=lambda k: k[1].lower()):
             for slot_idx, act in missing_detached_by_source[(st, sn)]:
-                lines.append(f"- {st}: {sn} :: Slot {slot_idx} :: {act} → (missing target)")
-    lines.append("")
+                emit(f"- {st}: {sn} :: Slot {slot_idx} :: {act} → (missing target)")
+    emit("")
 
-    lines.append("### Likely Broken Links (grey cube candidates)")
+    emit("### Likely Broken Links (grey cube candidates)")
     if not missing_broken_by_source:
-        lines.append("- none")
+        emit("- none")
     else:
         for (st, sn) in sorted(missing_broken_by_source.keys(), key=lambda k: k[1].lower()):
             for slot_idx, act in missing_broken_by_source[(st, sn)]:
-                lines.append(f"- {st}: {sn} :: Slot {slot_idx} :: {act} → (missing target)")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
-
-    # Timers
-    lines.append("## Timers (A→Z)")
-    lines.append("")
-    for name in sorted(timers.keys(), key=lambda s: s.lower()):
-        lines.append(f"### Timer: {name}")
-        lines.append("")
-        lines.append("Actions:")
-        rows = timers[name]
-        if not rows:
-            lines.append("- n/a")
-        else:
-            missing_class = classify_missing_source(name, rows)
-            for r in rows:
-                suffix = ""
-                if r.get("flag") == "MISSING_TARGET":
-                    suffix = " ⚪ likely detached" if missing_class == "LIKELY_DETACHED_AQR" else " 🧱 likely broken"
-                lines.append(f"- Slot {r.get('slot_index','')}: {r.get('action','')} → {r.get('target','')}{suffix}")
-        lines.append("")
-
-    # Events
-    lines.append("## Event Controllers (A→Z)")
-    lines.append("")
-    for name in sorted(events.keys(), key=lambda s: s.lower()):
-        lines.append(f"### Event Controller: {name}")
-        lines.append("")
-        lines.append("Actions:")
-        rows = events[name]
-        if not rows:
-            lines.append("- n/a")
-        else:
-            missing_class = classify_missing_source(name, rows)
-            for r in rows:
-                suffix = ""
-                if r.get("flag") == "MISSING_TARGET":
-                    suffix = " ⚪ likely detached" if missing_class == "LIKELY_DETACHED_AQR" else " 🧱 likely broken"
-                lines.append(f"- Slot {r.get('slot_index','')}: {r.get('action','')} → {r.get('target','')}{suffix}")
-        lines.append("")
-
-    return "\n".join(lines).strip() + "\n"
+                emit(f"- {st}: {sn} :: Slot {slot_idx} :: {act} → (missing target)")
+    emit("")
+    emit("---")
+    emit("")
 
+    _emit_section(emit, "## Timers (A→Z)", "Timer", timer_order)
+    emit("")
+    _emit_section(emit, "## Event Controllers (A→Z)", "Event Controller", event_order)
 
-def write_debug_csv(timers: Dict[str, List[dict]], events: Dict[str, List[dict]], out_csv: Path) -> None:
-    cols = ["source_type", "source_name", "slot_index", "action", "target", "target_kind", "flag"]
-    with out_csv.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=cols)
-        w.writeheader()
 
-        for name, rows in timers.items():
-            for r in rows:
-                w.writerow({
-                    "source_type": "Timer",
-                    "source_name": name,
-                    **{k: r.get(k, "") for k in cols if k not in ("source_type", "source_name")},
-                })
+def write_debug_csv(timers: Dict[str, Controller], events: Dict[str, Controller], out_csv: Path) -> None:
+    cols = ["source_type", "source_name", *Row._fields]
+    with out_csv.open("w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as f:
+        w = csv.writer(f)
+        w.writerow(cols)
 
-        for name, rows in events.items():
-            for r in rows:
-                w.writerow({
-                    "source_type": "EventController",
-                    "source_name": name,
-                    **{k: r.get(k, "") for k in cols if k not in ("source_type", "source_name")},
-                })
+        # One writerows() call per source type; csv pulls rows from the generator
+        for source_type, controllers in (("Timer", timers), ("EventController", events)):
+            w.writerows(
+                (source_type, name, *r)
+                for name, ctrl in controllers.items()
+                for r in ctrl.rows
+            )
 
 
 # -------------------------
@@ -426,7 +566,7 @@ def write_debug_csv(timers: Dict[str, List[dict]], events: Dict[str, List[dict]]
 
 def main() -> int:
     if len(sys.argv) < 2:
-        print("Usage: python3 se_logic_hud_v1_05.py bp.sbc [--out <file.md>] [--debug-csv]")
+        print("Usage: python3 se_logic_hud_v1_05.py bp.sbc [--out <file.md>] [--debug-csv] [--verbose]")
         return 2
 
     bp_path = Path(sys.argv[1]).expanduser().resolve()
@@ -437,6 +577,7 @@ def main() -> int:
     # Simple args (KISS; avoids argparse complexity for workshop users)
     out_override: Optional[str] = None
     debug_csv = False
+    verbose = False
 
     args = sys.argv[2:]
     i = 0
@@ -447,84 +588,76 @@ def main() -> int:
         elif args[i] == "--debug-csv":
             debug_csv = True
             i += 1
+        elif args[i] == "--verbose":
+            verbose = True
+            i += 1
         else:
             print(f"Unknown arg: {args[i]}")
-            print("Usage: python3 se_logic_hud_v1_05.py bp.sbc [--out <file.md>] [--debug-csv]")
+            print("Usage: python3 se_logic_hud_v1_05.py bp.sbc [--out <file.md>] [--debug-csv] [--verbose]")
             return 2
 
-    # Parse XML
-    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M")
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M")
+    now = datetime.now()
+    generated_at = now.strftime("%Y-%m-%d %H:%M")
+    timestamp = now.strftime("%Y%m%d-%H%M")
 
-    # We create logger after we know blueprint title (but we need root first), so:
-    # Parse first, then name files, then log.
+    # Title usually comes from the file head, so the log can be opened under its
+    # final name before the (slow) parse. Otherwise start under the file stem
+    # and rename once the parsed root yields the title.
     try:
-        tree = ET.parse(bp_path)
-        root = tree.getroot()
-    except Exception as e:
-        print(f"FAIL: XML parse error: {e}")
+        sniffed_title = sniff_blueprint_title(bp_path)
+    except OSError as e:
+        print(f"FAIL: cannot read input: {e}")
         return 1
 
-    bp_title = sanitize_filename(extract_blueprint_title(root, bp_path))
-    default_out = f"SE_Logic_HUD_{bp_title}_{timestamp}.md"
-    out_name = out_override if out_override else default_out
+    def log_path_for(title: str) -> Path:
+        return bp_path.parent / f"SE_Logic_HUD_{sanitize_filename(title)}_{timestamp}.log.txt"
 
-    log_name = f"SE_Logic_HUD_{bp_title}_{timestamp}.log.txt"
-    log_path = bp_path.parent / log_name
-    log = Logger(log_path)
+    log = Logger(log_path_for(sniffed_title or bp_path.stem), echo=verbose or sys.stdout.isatty())
 
     log.write(f"RCO SE Logic HUD v1.05")
     log.write(f"TIME: {generated_at}")
     log.write(f"INPUT: {bp_path}")
-    log.write(f"OUT:   {bp_path.parent / out_name}")
     log.write("")
 
-    # Index + extract
+    # Parse (single streaming pass: index + stash controllers)
     log.write("LOAD: bp.sbc")
+    try:
+        block_index, controllers, root = scan_blocks(bp_path)
+    except Exception as e:
+        log.write(f"FAIL: XML parse error: {e}", console=True)
+        log.write("DONE: FAILURE")
+        log.close()
+        return 1
     log.write("PARSE: XML OK")
 
-    block_index = build_block_index(root)
+    bp_title = sanitize_filename(sniffed_title or extract_blueprint_title(root, bp_path))
+    log.rename(log_path_for(bp_title))
+
+    default_out = f"SE_Logic_HUD_{bp_title}_{timestamp}.md"
+    out_name = out_override if out_override else default_out
+    log.write(f"OUT:   {bp_path.parent / out_name}")
+
     log.write(f"INDEX: blocks indexed = {len(block_index)}")
 
-    timers, events = extract_controllers(root, block_index)
+    timers, events = extract_controllers(controllers, block_index)
     log.write(f"EXTRACT: timers = {len(timers)}, event controllers = {len(events)}")
 
-    # Compute missing summary for log
-    missing_total = 0
-    missing_detached = 0
-    missing_broken = 0
-    empty_slots = 0
+    # Render only needs the extracted rows: release the XML (stashed controller
+    # elements + pruned skeleton) and the block index before writing outputs.
+    del block_index, controllers, root
+    gc.collect()
 
-    for name, rows in timers.items():
-        cls = classify_missing_source(name, rows)
-        for r in rows:
-            if r.get("flag") == "EMPTY_SLOT":
-                empty_slots += 1
-            if r.get("flag") == "MISSING_TARGET":
-                missing_total += 1
-                if cls == "LIKELY_DETACHED_AQR":
-                    missing_detached += 1
-                else:
-                    missing_broken += 1
-
-    for name, rows in events.items():
-        cls = classify_missing_source(name, rows)
-        for r in rows:
-            if r.get("flag") == "EMPTY_SLOT":
-                empty_slots += 1
-            if r.get("flag") == "MISSING_TARGET":
-                missing_total += 1
-                if cls == "LIKELY_DETACHED_AQR":
-                    missing_detached += 1
-                else:
-                    missing_broken += 1
-
-    log.write(f"RESOLVE: missing targets = {missing_total} (detached={missing_detached}, broken={missing_broken}), empty slots = {empty_slots}")
+    # Missing/attrition summary (reused by render_hud)
+    stats = compute_stats(timers, events)
+    log.write(
+        f"RESOLVE: missing targets = {stats.missing_total} "
+        f"(detached={stats.missing_detached}, broken={stats.missing_broken}), empty slots = {stats.empty_slots}"
+    )
 
     # Render + write HUD
-    hud_text = render_hud(timers, events, generated_at)
     out_path = bp_path.parent / out_name
-    out_path.write_text(hud_text, encoding="utf-8")
+    with out_path.open("w", encoding="utf-8", buffering=WRITE_BUFFER_BYTES) as out:
+        render_hud(timers, events, stats, generated_at, out)
     log.write(f"WRITE: {out_path.name}")
 
     # Optional debug CSV
@@ -534,7 +667,7 @@ def main() -> int:
         log.write(f"WRITE: {dbg_path.name} (debug)")
 
     log.write("DONE: SUCCESS")
-    log.flush_to_disk()
+    log.close()
     return 0
 
 